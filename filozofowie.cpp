@@ -80,7 +80,7 @@ private:
     }
 
     void display_loop() {
-        nodelay(stdscr, TRUE); // allow non-blocking key check
+        timeout(400); // getch blocks until a key arrives or the next redraw is due
         while (running) {
             {
                 std::lock_guard<std::mutex> lock(display_mutex);
@@ -125,7 +125,6 @@ private:
             if (ch == 'q' || ch == 'Q') {
                 stop();
             }
-            std::this_thread::sleep_for(std::chrono::milliseconds(400));
         }
     }
 